@@ -0,0 +1,19 @@
+from .core import (
+    DEFAULT_INTERVAL,
+    BaseMonitor,
+    StatusEvent,
+    close_session,
+    get_session,
+    load_providers,
+)
+from .web import WebMonitor
+
+__all__ = [
+    "DEFAULT_INTERVAL",
+    "BaseMonitor",
+    "StatusEvent",
+    "WebMonitor",
+    "close_session",
+    "get_session",
+    "load_providers",
+]
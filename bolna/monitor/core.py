@@ -0,0 +1,344 @@
+"""Provider polling, dedup and backoff shared by every monitor."""
+
+import asyncio
+import functools
+import json
+import random
+import re
+import sys
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import aiohttp
+import msgspec
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# aiohttp decodes br transparently, but only when brotli is importable
+try:
+    import brotli  # noqa: F401
+    _ACCEPT_ENCODING = "br, gzip"
+except ImportError:
+    _ACCEPT_ENCODING = "gzip"
+
+
+DEFAULT_INTERVAL = 30
+MAX_BACKOFF = 300
+SEEN_CAP = 200
+
+_MAX_AGE_RE = re.compile(r"\bmax-age=(\d+)")
+
+
+class StatusEvent(msgspec.Struct):
+    provider: str
+    product: str
+    message: str
+    timestamp: str
+
+
+class BaseMonitor:
+    """Polls statuspage.io-style providers and prints incident/component changes."""
+
+    def __init__(self, providers, interval=DEFAULT_INTERVAL):
+        self.providers = providers
+        self.interval = interval
+        self._urls = {
+            name: (f"{url}/incidents.json", f"{url}/components.json")
+            for name, url in providers.items()
+        }
+        self._seen = {name: OrderedDict() for name in providers}
+        self._warm = set()
+        self._page_ts = {}
+        self._comp_state = {}
+        # conditional GET headers, keyed by (provider, endpoint) and updated in place
+        self._cond_headers = {
+            (name, kind): {} for name in providers for kind in ("incidents", "components")
+        }
+        # per-endpoint retry state, keyed by (provider, endpoint)
+        self._attempts = {}
+        self._retry_at = {}
+        self._stop = asyncio.Event()
+        self._loop = None
+
+    async def run(self):
+        self._loop = asyncio.get_running_loop()
+        await self._tick(await get_session())
+
+    async def _tick(self, session):
+        """Polls every provider's incidents and components together, once per interval."""
+        while not self._stop.is_set():
+            keys = []
+            awaitables = []
+            for name, (inc_url, comp_url) in self._urls.items():
+                keys += [(name, "incidents"), (name, "components")]
+                awaitables.append(self._fetch_incidents(session, name, inc_url))
+                awaitables.append(self._fetch_components(session, name, comp_url))
+
+            results = await asyncio.gather(*awaitables, return_exceptions=True)
+            for (name, kind), res in zip(keys, results):
+                if isinstance(res, Exception):
+                    print(f"[warn] {name} {kind}: poll failed: {res!r}", file=sys.stderr)
+
+            try:
+                await asyncio.wait_for(self._stop.wait(), timeout=self.interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _fetch_incidents(self, session, name, url):
+        key = (name, "incidents")
+        if time.monotonic() < self._retry_at.get(key, 0):
+            return
+
+        try:
+            async with session.get(url, headers=self._cond_headers[key]) as resp:
+                # nothing changed since last poll, skip the body entirely
+                if resp.status == 304:
+                    self._ok(key, resp)
+                    return
+
+                if resp.status != 200:
+                    print(f"[warn] {name} incidents: HTTP {resp.status}", file=sys.stderr)
+                    self._fail(key, resp)
+                    return
+
+                data = _json_loads(await resp.read())
+                self._ok(key, resp)
+
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            print(f"[warn] {name}: {e}", file=sys.stderr)
+            self._fail(key)
+            return
+
+        # page-level updated_at only moves when something actually changes
+        ts = data.get("page", {}).get("updated_at", "")
+        if ts and ts == self._page_ts.get(name):
+            self._store_validators(key, resp)
+            return
+        self._page_ts[name] = ts
+
+        cold_start = name not in self._warm
+        for inc in data.get("incidents", []):
+            self._handle_incident(name, inc, cold_start)
+        self._warm.add(name)
+
+        # only once the body has been handled, otherwise a bad body gets 304'd forever
+        self._store_validators(key, resp)
+
+    async def _fetch_components(self, session, name, url):
+        """Watches individual product statuses (Chat Completions, Responses, etc.)"""
+        key = (name, "components")
+        if time.monotonic() < self._retry_at.get(key, 0):
+            return
+
+        try:
+            async with session.get(url, headers=self._cond_headers[key]) as resp:
+                if resp.status == 304:
+                    self._ok(key, resp)
+                    return
+
+                if resp.status != 200:
+                    self._fail(key, resp)
+                    return
+
+                data = _json_loads(await resp.read())
+                self._ok(key, resp)
+
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            print(f"[warn] {name} components: {e}", file=sys.stderr)
+            self._fail(key)
+            return
+
+        prev = self._comp_state.get(name, {})
+        current = {}
+
+        for comp in data.get("components", []):
+            cid = comp["id"]
+            status = comp["status"]
+            current[cid] = status
+
+            # first poll just records the baseline
+            if not prev:
+                continue
+
+            old = prev.get(cid)
+            if old and old != status:
+                self._deliver(StatusEvent(
+                    provider=name,
+                    product=comp["name"],
+                    message=status.replace("_", " "),
+                    timestamp=_fmt_ts(comp.get("updated_at", "")),
+                ))
+
+        # on first poll, emit a startup summary so the page isn't blank
+        if not prev and current:
+            degraded = [c for c in data.get("components", []) if c["status"] != "operational"]
+            now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+            if degraded:
+                for c in degraded:
+                    self._deliver(StatusEvent(
+                        provider=name, product=c["name"],
+                        message=c["status"].replace("_", " "),
+                        timestamp=_fmt_ts(now),
+                    ))
+            else:
+                self._deliver(StatusEvent(
+                    provider=name, product="all services",
+                    message=f"{len(current)} components operational",
+                    timestamp=_fmt_ts(now),
+                ))
+
+        self._comp_state[name] = current
+        self._store_validators(key, resp)
+
+    def _ok(self, key, resp):
+        self._attempts.pop(key, None)
+        self._retry_at.pop(key, None)
+
+        # polling faster than the CDN's max-age just re-fetches the same bytes
+        hint = min(_parse_max_age(resp.headers.get("Cache-Control", "")), MAX_BACKOFF)
+        if hint > self.interval:
+            self._retry_at[key] = time.monotonic() + hint
+
+    def _fail(self, key, resp=None):
+        """Skips this endpoint for a full-jitter exponential backoff.
+
+        Randomizing over the whole window keeps providers that failed
+        together from retrying in lockstep.
+        """
+        attempt = self._attempts.get(key, 0) + 1
+        self._attempts[key] = attempt
+        delay = random.uniform(0, min(MAX_BACKOFF, self.interval * 2 ** attempt))
+        if resp is not None and resp.status in (429, 503):
+            hint = _parse_retry_after(resp.headers.get("Retry-After", ""))
+            delay = max(delay, min(hint, MAX_BACKOFF))
+        self._retry_at[key] = time.monotonic() + delay
+
+    def _store_validators(self, key, resp):
+        # one request per endpoint is in flight at a time, so mutating is safe
+        headers = self._cond_headers[key]
+        for resp_name, req_name in (("ETag", "If-None-Match"), ("Last-Modified", "If-Modified-Since")):
+            value = resp.headers.get(resp_name)
+            if value:
+                headers[req_name] = value
+            else:
+                headers.pop(req_name, None)
+
+    def _handle_incident(self, provider, inc, cold_start):
+        updates = inc.get("incident_updates", [])
+        inc_id = inc["id"]
+        n_updates = len(updates)
+
+        # an incident only needs re-emitting when its update count moves;
+        # bounded LRU of id -> count so this doesn't grow forever
+        seen = self._seen[provider]
+        if seen.get(inc_id) == n_updates:
+            seen.move_to_end(inc_id)
+            return
+        seen[inc_id] = n_updates
+        seen.move_to_end(inc_id)
+        if len(seen) > SEEN_CAP:
+            seen.popitem(last=False)
+
+        if cold_start and inc.get("status") == "resolved":
+            return
+
+        if updates:
+            latest = updates[0]
+            body = (latest.get("body") or "").strip()
+            msg = body if body else latest.get("status", "unknown")
+            raw_ts = latest.get("display_at") or latest.get("updated_at", "")
+        else:
+            msg = inc.get("status", "unknown")
+            raw_ts = inc.get("updated_at", "")
+
+        self._deliver(StatusEvent(
+            provider=provider,
+            product=inc.get("name", "Unknown"),
+            message=msg,
+            timestamp=_fmt_ts(raw_ts),
+        ))
+
+    def _deliver(self, ev):
+        """Runs inline at the poller. Returns the printed line so subclasses can fan it out."""
+        line = f"[{ev.timestamp}] Product: {ev.provider} - {ev.product}\n  Status: {ev.message}"
+        sys.stdout.write(line + "\n\n")
+        # a tty flushes on the newline by itself; piped output would otherwise sit in the buffer
+        if not sys.stdout.line_buffering:
+            sys.stdout.flush()
+        return line
+
+    def stop(self):
+        """Safe to call from outside the loop too; the wakeups are posted onto it."""
+        if self._loop is None:
+            self._stop.set()
+        else:
+            self._loop.call_soon_threadsafe(self._stop.set)
+
+
+_session = None
+
+
+async def get_session():
+    """Process-wide ClientSession so every poller shares one connection pool."""
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=100, limit_per_host=6, enable_cleanup_closed=True),
+            timeout=aiohttp.ClientTimeout(total=15),
+            headers={"Accept-Encoding": _ACCEPT_ENCODING},
+        )
+    return _session
+
+
+async def close_session():
+    global _session
+    if _session is not None:
+        await _session.close()
+        _session = None
+
+
+def _parse_max_age(cache_control):
+    m = _MAX_AGE_RE.search(cache_control)
+    return int(m.group(1)) if m else 0
+
+
+def _parse_retry_after(value):
+    """Retry-After is either a number of seconds or an HTTP date."""
+    if not value:
+        return 0
+    if value.isdigit():
+        return int(value)
+    try:
+        dt = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return 0
+    # a -0000 zone parses as naive, but it still means UTC
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return max(0, (dt - datetime.now(timezone.utc)).total_seconds())
+
+
+# the same updated_at strings come back poll after poll
+@functools.lru_cache(maxsize=4096)
+def _fmt_ts(raw):
+    if not raw:
+        return "unknown"
+    try:
+        dt = datetime.fromisoformat(raw.replace("Z", "+00:00"))
+        return dt.strftime("%Y-%m-%d %H:%M:%S")
+    except ValueError:
+        return raw
+
+
+def load_providers(path):
+    with open(path) as f:
+        data = json.load(f)
+    if not isinstance(data, dict):
+        raise ValueError("expected JSON object mapping provider names to base URLs")
+    return data
@@ -0,0 +1,132 @@
+"""SSE web UI on top of BaseMonitor."""
+
+import asyncio
+from collections import deque
+from itertools import islice
+
+from aiohttp import web
+
+from .core import DEFAULT_INTERVAL, BaseMonitor
+
+
+EVENT_LOG_SIZE = 50
+SSE_MAX_DROPS = 10
+SSE_WRITE_TIMEOUT = 30
+
+INDEX_PAGE = """<!DOCTYPE html>
+<html><head><title>Status Tracker</title></head>
+<body style="margin:0;background:#0d1117;color:#c9d1d9;font-family:ui-monospace,monospace;font-size:14px">
+<div style="max-width:900px;margin:0 auto;padding:24px">
+<h2 style="color:#58a6ff;margin-bottom:4px">status tracker</h2>
+<p id="status" style="color:#8b949e;margin-top:0">connecting...</p>
+<div id="log" style="border:1px solid #30363d;border-radius:6px;padding:16px;min-height:200px"></div>
+</div>
+<script>
+const log = document.getElementById("log");
+const status = document.getElementById("status");
+let count = 0;
+const es = new EventSource("/events");
+es.onopen = () => { status.textContent = "connected — streaming updates"; status.style.color = "#3fb950"; };
+es.onmessage = e => {
+    count++;
+    status.textContent = count + " event" + (count === 1 ? "" : "s") + " received";
+    const pre = document.createElement("pre");
+    pre.style.cssText = "margin:0;padding:10px 12px;border-bottom:1px solid #21262d;white-space:pre-wrap";
+    pre.textContent = e.data;
+    log.prepend(pre);
+};
+es.onerror = () => { status.textContent = "connection lost, reconnecting..."; status.style.color = "#f85149"; };
+</script></body></html>"""
+
+
+class WebMonitor(BaseMonitor):
+    """BaseMonitor plus a web UI that streams every event to browsers over SSE."""
+
+    def __init__(self, providers, interval=DEFAULT_INTERVAL, port=8080):
+        super().__init__(providers, interval=interval)
+        self.port = port
+        # append-only broadcast log; SSE clients tail it by sequence number
+        self._event_log = deque(maxlen=EVENT_LOG_SIZE)
+        self._seq = 0
+        self._new_event = asyncio.Event()
+
+    async def run(self):
+        await asyncio.gather(super().run(), self._serve(self.port))
+
+    def _deliver(self, ev):
+        line = super()._deliver(ev)
+
+        # encoded once here and shared by every SSE client;
+        # doubles as the replay buffer for late-joining ones
+        self._event_log.append(_sse_frame(line))
+        self._seq += 1
+        self._new_event.set()
+        self._new_event.clear()
+        return line
+
+    async def _serve(self, port):
+        app = web.Application()
+        app.router.add_get("/", self._web_index)
+        app.router.add_get("/events", self._web_sse)
+        app.router.add_get("/health", self._web_health)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "0.0.0.0", port)
+        await site.start()
+        print(f"web ui: http://0.0.0.0:{port}\n")
+
+    async def _web_index(self, req):
+        return web.Response(text=INDEX_PAGE, content_type="text/html")
+
+    async def _web_health(self, req):
+        return web.json_response({
+            "status": "ok",
+            "providers": len(self.providers),
+            "events_buffered": len(self._event_log),
+        })
+
+    async def _web_sse(self, req):
+        resp = web.StreamResponse()
+        resp.headers["Content-Type"] = "text/event-stream"
+        resp.headers["Cache-Control"] = "no-cache"
+        resp.headers["X-Accel-Buffering"] = "no"
+        await resp.prepare(req)
+
+        # start from the oldest buffered event so late-joining clients aren't staring at a blank page
+        last_seq = self._seq - len(self._event_log)
+        drops = 0
+        try:
+            while True:
+                if last_seq == self._seq:
+                    await self._new_event.wait()
+                    continue
+
+                # anything older than the log's tail has been evicted and is skipped
+                base_seq = self._seq - len(self._event_log)
+                pending = islice(self._event_log, max(last_seq - base_seq, 0), None)
+                chunk = b"".join(pending)
+                last_seq = self._seq
+                await asyncio.wait_for(resp.write(chunk), SSE_WRITE_TIMEOUT)
+
+                # only evictions while we were stuck in write are this client's fault,
+                # a burst landing while it sat idle in wait() doesn't count;
+                # a client that keeps falling that far behind gets cut loose
+                missed = self._seq - len(self._event_log) - last_seq
+                if missed > 0:
+                    drops += missed
+                    if drops > SSE_MAX_DROPS:
+                        break
+                else:
+                    drops = 0
+        except asyncio.TimeoutError:
+            # client stopped draining its socket altogether, don't wait on it
+            if req.transport is not None:
+                req.transport.abort()
+        except (ConnectionResetError, asyncio.CancelledError):
+            pass
+        return resp
+
+
+def _sse_frame(text):
+    """SSE spec requires each line of a multi-line message to carry its own data: prefix."""
+    return "".join(f"data: {part}\n" for part in text.split("\n")).encode() + b"\n"